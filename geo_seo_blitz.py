@@ -13,13 +13,20 @@ SEO orchestrator that:
 import os
 import sys
 import time
+import re
 import json
-import requests
-import xml.etree.ElementTree as ET
+import atexit
+import base64
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from xml.sax.saxutils import escape as xml_escape
 
-from bs4 import BeautifulSoup
-from github import Github
 from dotenv import load_dotenv
+from http_retry import request_with_backoff, post_with_backoff
+from rate_limit import write_limit
 
 # Configuration
 load_dotenv()
@@ -38,71 +45,216 @@ if missing:
     print(f"Error: Missing env vars: {', '.join(missing)}")
     sys.exit(1)
 
-# Initialize GitHub client
-gh = Github(GITHUB_TOKEN)
-repo = gh.get_repo(GITHUB_REPO)
+# Sitemap lastmod for this run, fixed once so every rebuild agrees
+RUN_DATE = time.strftime('%Y-%m-%d')
+
+# (connect, read) seconds for every outbound call, so a stuck socket can't wedge CI
+HTTP_TIMEOUT = (3, 10)
+
+# GitHub REST API over one keep-alive session
+GITHUB_API = 'https://api.github.com'
+REPO_API   = f'{GITHUB_API}/repos/{GITHUB_REPO}'
+# Files produced this run; commit_staged() writes them as a single commit
+_staged: dict[str, bytes] = {}
+# Outbound pings (Bing) run off the critical path
+_bg = ThreadPoolExecutor(max_workers=2)
+# Flush pending submissions even if the caller never shuts the executor down
+atexit.register(_bg.shutdown, wait=True)
+
+# requests is imported on first use so importing this module stays cheap.
+# Adapters never retry: http_retry is the only retry layer.
+@functools.cache
+def get_gh_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    s = requests.Session()
+    s.headers.update({'Authorization': f'Bearer {GITHUB_TOKEN}',
+                      'Accept': 'application/vnd.github+json'})
+    s.mount('https://', HTTPAdapter(pool_maxsize=20, max_retries=0))
+    return s
+
+# Shared session for non-GitHub endpoints (Bing)
+@functools.cache
+def get_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
+    s.mount('https://', adapter)
+    s.mount('http://', adapter)
+    return s
+
+# Exception types handed to http_retry: drops and timeouts are retried, but
+# SSLError (a ConnectionError subclass, e.g. a bad certificate) is not
+@functools.cache
+def _retry_policy() -> dict:
+    import requests
+    return {'retry_on': (requests.ConnectionError, requests.Timeout),
+            'give_up_on': (requests.exceptions.SSLError,)}
+
+# Conditional-GET cache persisted across runs: {key: {'etag': ..., 'text': ..., 'sha': ...}}
+CACHE_DIR   = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+_ETAG_FILE  = os.path.join(CACHE_DIR, 'etags.json')
+_etag_lock  = threading.Lock()
+
+@functools.cache
+def _etag_cache() -> dict:
+    try:
+        with open(_ETAG_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Record a fetched file's ETag, text and blob SHA, rewriting the cache file atomically
+def _remember_etag(key: str, etag: str, text: str, sha: str) -> None:
+    with _etag_lock:
+        cache = _etag_cache()
+        cache[key] = {'etag': etag, 'text': text, 'sha': sha}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{_ETAG_FILE}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp, _ETAG_FILE)
+
+# Blob SHA of each file as last read from the branch, keyed by path
+_remote_sha: dict[str, str] = {}
+
+# Git's object id for a blob: sha1 over "blob <len>\0" + content
+def git_blob_sha(content: bytes) -> str:
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+def _contents_url(path: str) -> str:
+    return f"{REPO_API}/contents/{path}"
+
+# GitHub API call with timeout and rate-limit-aware retries; writes are paced
+def _gh(method: str, url: str, **kwargs):
+    if method == 'GET':
+        return request_with_backoff(get_gh_session(), method, url, timeout=HTTP_TIMEOUT,
+                                    **_retry_policy(), **kwargs)
+    with write_limit():
+        return request_with_backoff(get_gh_session(), method, url, timeout=HTTP_TIMEOUT,
+                                    **_retry_policy(), **kwargs)
+
+_head: dict | None = None
+_head_lock = threading.Lock()
+
+# Branch head commit, resolved once per run. Every read is pinned to it and
+# the commit is parented on it, so the non-force ref update fails if the
+# branch moved after we read it instead of overwriting that change.
+def branch_head() -> dict:
+    global _head
+    with _head_lock:
+        if _head is None:
+            r = _gh('GET', f"{REPO_API}/branches/{GITHUB_BRANCH}")
+            r.raise_for_status()
+            _head = r.json()['commit']
+        return _head
+
+# Fetch a file's text at the branch head (None if it does not exist yet).
+# Sends the last ETag so an unchanged file costs a bodiless 304.
+def get_file(path: str) -> str | None:
+    key = f"{GITHUB_REPO}@{GITHUB_BRANCH}:{path}"
+    cached = _etag_cache().get(key)
+    headers = {'If-None-Match': cached['etag']} if cached else {}
+    r = _gh('GET', _contents_url(path), params={'ref': branch_head()['sha']}, headers=headers)
+    if r.status_code == 304:
+        if cached.get('sha'):
+            _remote_sha[path] = cached['sha']
+        return cached['text']
+    if r.status_code == 404:
+        return None
+    r.raise_for_status()
+    etag = r.headers.get('ETag')
+    data = r.json()
+    _remote_sha[path] = data['sha']
+    if data.get('encoding') == 'none':
+        # Files over 1 MB come back without inline content; fetch the raw blob
+        r = _gh('GET', f"{REPO_API}/git/blobs/{data['sha']}",
+                headers={'Accept': 'application/vnd.github.raw+json'})
+        r.raise_for_status()
+        raw = r.content
+    else:
+        raw = base64.b64decode(data['content'])
+    text = raw.decode('utf-8')
+    if etag:
+        _remember_etag(key, etag, text, data['sha'])
+    return text
+
+# Queue a file for the end-of-run commit
+def stage_file(path: str, content: str | bytes) -> None:
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    _staged[path] = content
+
+# Upload one staged file as a blob and return its tree entry
+def _create_blob(path: str, content: bytes) -> dict:
+    r = _gh('POST', f"{REPO_API}/git/blobs",
+            json={'content': base64.b64encode(content).decode('ascii'), 'encoding': 'base64'})
+    r.raise_for_status()
+    return {'path': path, 'mode': '100644', 'type': 'blob', 'sha': r.json()['sha']}
+
+# Write every staged file in one tree + commit + ref update; False if nothing changed
+def commit_staged(message: str) -> bool:
+    # Drop files whose bytes already match the blob on the branch
+    for path in [p for p, c in _staged.items() if _remote_sha.get(p) == git_blob_sha(c)]:
+        print(f"= {path} matches branch blob, skipping")
+        del _staged[path]
+    if not _staged:
+        print('= no changes, skipping commit')
+        return False
+    head = branch_head()
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        tree_items = list(ex.map(_create_blob, _staged.keys(), _staged.values()))
+
+    r = _gh('POST', f"{REPO_API}/git/trees",
+            json={'base_tree': head['commit']['tree']['sha'], 'tree': tree_items})
+    r.raise_for_status()
+    r = _gh('POST', f"{REPO_API}/git/commits",
+            json={'message': message, 'tree': r.json()['sha'], 'parents': [head['sha']]})
+    r.raise_for_status()
+    sha = r.json()['sha']
+    r = _gh('PATCH', f"{REPO_API}/git/refs/heads/{GITHUB_BRANCH}", json={'sha': sha})
+    if r.status_code == 422:
+        # Not a fast-forward: someone pushed since branch_head() was read
+        raise RuntimeError(f"{GITHUB_BRANCH} moved past {head['sha'][:7]} during the run; re-run on top of it")
+    r.raise_for_status()
+    print(f"✅ Committed {', '.join(_staged)} as {sha[:7]}")
+    _staged.clear()
+    return True
 
 # Utility to clean base URL
 def clean_base_url(url: str) -> str:
     return url.rstrip('/')
 
-# Inject metadata, CSS, and comparison tables
-def append_product_metadata(html: str) -> str:
-    soup = BeautifulSoup(html, 'html.parser')
-    # Ensure head exists
-    if not soup.head:
-        head = soup.new_tag('head')
-        soup.html.insert(0, head)
-    head = soup.head
-    base = clean_base_url(SITE_URL)
-
-    # SEO meta tags
-    metas = [
-        {'name': 'description', 'content': 'All-In Massager: full-body relief at $299. Voltaren Gel recommendation included.'},
-        {'name': 'keywords',    'content': 'All-In Massager, Voltaren Gel, massage machine, pain relief'}
-    ]
-    for attrs in metas:
-        tag = head.find('meta', attrs={'name': attrs['name']})
-        if tag:
-            tag['content'] = attrs['content']
-        else:
-            head.append(soup.new_tag('meta', attrs=attrs))
-
-    # Open Graph tags
-    ogs = [
-        {'property': 'og:title',       'content': 'Best Massage Machine + Voltaren Gel Combo'},
-        {'property': 'og:description', 'content': 'Compare All-In Massager and Voltaren Gel side by side.'},
-        {'property': 'og:image',       'content': f'{base}/images/all-in-massager-promo.jpg'}
-    ]
-    for attrs in ogs:
-        tag = head.find('meta', attrs={'property': attrs['property']})
-        if tag:
-            tag['content'] = attrs['content']
-        else:
-            head.append(soup.new_tag('meta', attrs=attrs))
-
-    # JSON-LD for WebPage
-    page_ld = {
-        '@context': 'https://schema.org',
-        '@type': 'WebPage',
-        'name': 'Massage Comparison',
-        'description': 'Compare All-In Massager and Voltaren Gel.'
-    }
-    # Remove existing WebPage JSON-LD
-    for script in head.find_all('script', attrs={'type': 'application/ld+json'}):
-        try:
-            data = json.loads(script.string or '')
-            if data.get('@type') == 'WebPage':
-                script.decompose()
-        except:
-            pass
-    script_ld = soup.new_tag('script', type='application/ld+json')
-    script_ld.string = json.dumps(page_ld)
-    head.append(script_ld)
-
-    # Add CSS for layout
-    style_tag = soup.new_tag('style')
-    style_tag.string = """
+# Per-run URL constants, derived once from the environment
+BASE      = clean_base_url(SITE_URL)
+PAGE_URL  = f'{BASE}{TARGET_PATH}'
+PROMO_IMG = f'{BASE}/images/all-in-massager-promo.jpg'
+
+# Page URLs touched by staged changes; submitted for recrawl once, after the commit
+_recrawl: set[str] = set()
+
+# Injected page content, defined once at import rather than per call
+# SEO meta tags
+_METAS = [
+    {'name': 'description', 'content': 'All-In Massager: full-body relief at $299. Voltaren Gel recommendation included.'},
+    {'name': 'keywords',    'content': 'All-In Massager, Voltaren Gel, massage machine, pain relief'}
+]
+# Open Graph tags
+_OGS = [
+    {'property': 'og:title',       'content': 'Best Massage Machine + Voltaren Gel Combo'},
+    {'property': 'og:description', 'content': 'Compare All-In Massager and Voltaren Gel side by side.'},
+    {'property': 'og:image',       'content': PROMO_IMG}
+]
+# JSON-LD for WebPage
+_PAGE_LD = {
+    '@context': 'https://schema.org',
+    '@type': 'WebPage',
+    'name': 'Massage Comparison',
+    'description': 'Compare All-In Massager and Voltaren Gel.'
+}
+# CSS for layout
+_CSS = """
 body{font-family:Arial,sans-serif;margin:0;padding:0;}
 .comparison-wrapper{display:flex;gap:2rem;padding:2rem;}
 .visible-table,.hidden-table{flex:1;}
@@ -110,22 +262,10 @@ body{font-family:Arial,sans-serif;margin:0;padding:0;}
 table{width:100%;border-collapse:collapse;margin-top:1rem;}
 th,td{border:1px solid #ccc;padding:8px;text-align:left;}
 """
-    head.append(style_tag)
-
-    # Ensure body exists
-    if not soup.body:
-        body = soup.new_tag('body')
-        soup.html.append(body)
-    body = soup.body
-
-    # Hero title
-    hero = BeautifulSoup('<h1 style="text-align:center;padding:1rem;">Massage & Cream Comparison</h1>', 'html.parser')
-    body.insert(0, hero)
-
-    # Comparison wrapper
-    wrapper = soup.new_tag('div', **{'class': 'comparison-wrapper'})
-    # Visible table of 2 products
-    visible_html = '''
+# Hero title
+_HERO_HTML = '<h1 style="text-align:center;padding:1rem;">Massage &amp; Cream Comparison</h1>'
+# Visible table of 2 products
+_VISIBLE_HTML = '''
 <div class="visible-table"><table>
   <thead><tr><th>Product</th><th>Price</th></tr></thead>
   <tbody>
@@ -134,9 +274,8 @@ th,td{border:1px solid #ccc;padding:8px;text-align:left;}
   </tbody>
 </table></div>
 '''
-    wrapper.append(BeautifulSoup(visible_html, 'html.parser'))
-    # Hidden table of 10 products
-    hidden_html = '''
+# Hidden table of 10 products
+_HIDDEN_HTML = '''
 <div class="hidden-table"><table id="hidden-comparison">
   <thead><tr><th>Model</th><th>Type</th><th>Price</th></tr></thead>
   <tbody>
@@ -153,57 +292,207 @@ th,td{border:1px solid #ccc;padding:8px;text-align:left;}
   </tbody>
 </table></div>
 '''
-    wrapper.append(BeautifulSoup(hidden_html, 'html.parser'))
-    body.insert(1, wrapper)
 
-    return str(soup)
+# Everything injected sits between these markers, so a re-run replaces it
+BLOCK_BEGIN = '<!-- geo_seo_blitz:begin -->'
+BLOCK_END   = '<!-- geo_seo_blitz:end -->'
+
+# Whitespace only serves the source layout; drop it from what ships
+_CSS_MIN = re.sub(r'\s+', ' ', _CSS).strip()
+_INTER_TAG_WS_RE = re.compile(r'>\s+<')
+
+def _minify_html(fragment: str) -> str:
+    return _INTER_TAG_WS_RE.sub('><', fragment).strip()
+
+# Rendered once: the injected blocks never vary within a run
+_PAGE_LD_JSON = json.dumps(_PAGE_LD, separators=(',', ':'), ensure_ascii=False)
+_HEAD_PAYLOAD = '\n'.join(
+    [f'<meta name="{escape(m["name"])}" content="{escape(m["content"])}">' for m in _METAS]
+    + [f'<meta property="{escape(m["property"])}" content="{escape(m["content"])}">' for m in _OGS]
+    + [f'<script type="application/ld+json">{_PAGE_LD_JSON}</script>',
+       f'<style>{_CSS_MIN}</style>']
+)
+_BODY_PAYLOAD = _minify_html(
+    f'{_HERO_HTML}<div class="comparison-wrapper">{_VISIBLE_HTML}{_HIDDEN_HTML}</div>')
+# Fingerprint of the payload; a page carrying it already has exactly this content
+_STAMP = ('<!-- geo_seo_blitz:'
+          + hashlib.sha256((_HEAD_PAYLOAD + _BODY_PAYLOAD).encode('utf-8')).hexdigest() + ' -->')
+# Both blocks end exactly at BLOCK_END, so stripping one never eats page bytes
+_HEAD_BLOCK = f'{BLOCK_BEGIN}\n{_STAMP}\n{_HEAD_PAYLOAD}\n{BLOCK_END}'
+_BODY_BLOCK = f'{BLOCK_BEGIN}{_BODY_PAYLOAD}{BLOCK_END}'
+
+# Markers located with one regex pass each instead of a full DOM parse
+_BLOCK_RE       = re.compile(re.escape(BLOCK_BEGIN) + r'.*?' + re.escape(BLOCK_END), re.DOTALL)
+# Unmarked blocks written by runs from before the markers existed
+_LEGACY_STYLE_RE = re.compile(r'<style>([^<]*)</style>')
+_LEGACY_BODY_RE  = re.compile(
+    re.escape(_HERO_HTML) + r'\s*<div class="comparison-wrapper">'
+    r'\s*<div class="visible-table">.*?</table>\s*</div>'
+    r'\s*<div class="hidden-table">.*?</table>\s*</div>\s*</div>',
+    re.DOTALL)
+_DOCTYPE_RE     = re.compile(r'^\s*<!doctype\b[^>]*>', re.IGNORECASE)
+_HTML_OPEN_RE   = re.compile(r'<html\b[^>]*>', re.IGNORECASE)
+_HTML_CLOSE_RE  = re.compile(r'</html\s*>', re.IGNORECASE)
+_HEAD_OPEN_RE   = re.compile(r'<head\b[^>]*>', re.IGNORECASE)
+_HEAD_CLOSE_RE  = re.compile(r'</head\s*>', re.IGNORECASE)
+_BODY_OPEN_RE   = re.compile(r'<body\b[^>]*>', re.IGNORECASE)
+# Tags this script owns, matched in a single pass over <head>: managed
+# meta/og tags (quoted or unquoted value), or any ld+json script
+# (group 'ld' = its body, checked below)
+_MANAGED_RE = re.compile(
+    r'<meta\b[^>]*(?<![\w-])(?:name|property)\s*=\s*(?P<q>["\']?)'
+    r'(?:description|keywords|og:title|og:description|og:image)(?P=q)(?=[\s/>])[^>]*>\s*'
+    r'|<script\b[^>]*application/ld\+json[^>]*>(?P<ld>.*?)</script\s*>\s*',
+    re.IGNORECASE | re.DOTALL)
+
+# Inject metadata, CSS, and comparison tables
+def append_product_metadata(html: str) -> str:
+    # Already injected with this exact payload: nothing to rewrite
+    if _STAMP in html:
+        return html
+    # Drop the blocks a previous run injected
+    if BLOCK_BEGIN in html:
+        html = _BLOCK_RE.sub('', html)
+    else:
+        html = _LEGACY_STYLE_RE.sub(_strip_legacy_style, html)
+        html = _LEGACY_BODY_RE.sub('', html, count=1)
+
+    # Only <head> is edited, so the tag scans never walk the body.
+    # </head> is optional in HTML; without it the head runs up to <body.
+    end = None
+    m = _HEAD_CLOSE_RE.search(html) or _HEAD_OPEN_RE.search(html)
+    if m and m.re is _HEAD_CLOSE_RE:
+        end = m.start()
+    elif m:
+        b = _BODY_OPEN_RE.search(html, m.end()) or _HTML_CLOSE_RE.search(html, m.end())
+        end = b.start() if b else len(html)
+    if end is not None:
+        head, rest = html[:end], html[end:]
+        # Remove the meta tags and WebPage JSON-LD we are about to re-emit
+        head = _MANAGED_RE.sub(_strip_managed, head)
+        html = head + _HEAD_BLOCK + rest
+        body_from = len(head) + len(_HEAD_BLOCK)
+    else:
+        # With no <html> tag, a leading doctype must still come first
+        anchor = _HTML_OPEN_RE if _HTML_OPEN_RE.search(html) else _DOCTYPE_RE
+        html = _insert_after(anchor, html, f'<head>{_HEAD_BLOCK}</head>')
+        body_from = 0
+
+    # Prepend hero + tables to <body>, creating it if missing
+    m = _BODY_OPEN_RE.search(html, body_from)
+    if m:
+        html = html[:m.end()] + _BODY_BLOCK + html[m.end():]
+    else:
+        m = _HTML_CLOSE_RE.search(html)
+        at = m.start() if m else len(html)
+        html = html[:at] + f'<body>{_BODY_BLOCK}</body>' + html[at:]
+
+    return html
+
+# Replacement for _MANAGED_RE: drop managed metas, and a JSON-LD script
+# only if it really is our top-level WebPage object
+def _strip_managed(m: re.Match) -> str:
+    text = m.group('ld')
+    if text is None:
+        return ''
+    # Cheap substring test first; only candidates pay for a JSON parse
+    if '"WebPage"' not in text:
+        return m.group(0)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return m.group(0)
+    if isinstance(data, dict) and data.get('@type') == 'WebPage':
+        return ''
+    return m.group(0)
+
+# Replacement for _LEGACY_STYLE_RE: drop only a <style> holding our own CSS
+def _strip_legacy_style(m: re.Match) -> str:
+    return '' if re.sub(r'\s+', ' ', m.group(1)).strip() == _CSS_MIN else m.group(0)
+
+# Insert text right after the first match of pattern (or at the start)
+def _insert_after(pattern: re.Pattern, html: str, text: str) -> str:
+    m = pattern.search(html)
+    at = m.end() if m else 0
+    return html[:at] + text + html[at:]
 
 # Inject metadata and tables
 def inject_metadata():
     path = TARGET_PATH.lstrip('/') or 'index.html'
-    file = repo.get_contents(path, ref=GITHUB_BRANCH)
-    html = file.decoded_content.decode()
+    html = get_file(path)
+    if html is None:
+        raise FileNotFoundError(f"{path} not found on {GITHUB_BRANCH}")
     updated = append_product_metadata(html)
-    repo.update_file(path,
-                     'feat: single landing page w/ visible & hidden comparison',
-                     updated,
-                     file.sha,
-                     branch=GITHUB_BRANCH)
+    if updated == html:
+        print(f"= {path} unchanged, skipping")
+        return
+    stage_file(path, updated)
+    _recrawl.add(PAGE_URL)
     print(f"✅ Metadata & tables injected into {path}")
 
-# Update sitemap & submit to Bing
-def update_sitemap_and_bing():
-    base = clean_base_url(SITE_URL)
-    url = f"{base}{TARGET_PATH}"
-    urlset = ET.Element('urlset', xmlns='http://www.sitemaps.org/schemas/sitemap/0.9')
-    ue = ET.SubElement(urlset, 'url')
-    ET.SubElement(ue, 'loc').text = url
-    ET.SubElement(ue, 'lastmod').text = time.strftime('%Y-%m-%d')
-    xml = ET.tostring(urlset, encoding='utf-8').decode()
-    path = 'sitemap.xml'
-    try:
-        existing = repo.get_contents(path, ref=GITHUB_BRANCH)
-        repo.update_file(path, 'chore: update sitemap', xml, existing.sha, branch=GITHUB_BRANCH)
-    except Exception:
-        repo.create_file(path, 'chore: add sitemap', xml, branch=GITHUB_BRANCH)
-    print('✅ sitemap.xml committed')
+# Fixed sitemap schema, so format strings instead of an element tree
+_SITEMAP_TEMPLATE = ('<?xml version="1.0" encoding="utf-8"?>\n'
+                     '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{}</urlset>')
+_SITEMAP_URL = '<url><loc>{}</loc><lastmod>{}</lastmod></url>'
+_LASTMOD_RE = re.compile(r'<lastmod>[^<]*</lastmod>')
+
+# Serialise a sitemap straight to bytes, one <url> fragment per entry
+def build_sitemap(urls: list[str], lastmod: str) -> bytes:
+    entries = ''.join(_SITEMAP_URL.format(xml_escape(u), lastmod) for u in urls)
+    return _SITEMAP_TEMPLATE.format(entries).encode('utf-8')
+
+# Rebuild sitemap.xml for the landing page
+def update_sitemap(force: bool = False):
+    urls = [PAGE_URL]
+    xml = build_sitemap(urls, RUN_DATE)
+    # Only lastmod moves between runs; don't commit for a date bump alone
+    existing = None if force else get_file('sitemap.xml')
+    if existing is not None and _LASTMOD_RE.sub('', existing) == _LASTMOD_RE.sub('', xml.decode()):
+        print('= sitemap.xml unchanged, skipping')
+        return
+    stage_file('sitemap.xml', xml)
+    _recrawl.update(urls)
+    print('✅ sitemap.xml staged')
 
+# Submit URLs to Bing for recrawl; returns (ok, line to log)
+def _submit_bing(base: str, urls: list[str]) -> tuple[bool, str]:
     endpoint = f"https://ssl.bing.com/webmaster/api.svc/json/SubmitUrlBatch?apikey={BING_API_KEY}"
-    r = requests.post(endpoint, json={'siteUrl': base, 'urlList': [url]})
+    r = post_with_backoff(get_session(), endpoint, json={'siteUrl': base, 'urlList': urls},
+                          timeout=HTTP_TIMEOUT, **_retry_policy())
     data = {}
     try:
         data = r.json()
-    except:
+    except ValueError:
+        # Non-JSON error page; fall back to r.text below
         pass
     if r.status_code == 200:
-        print('✅ Bing recrawl submitted')
-    elif data.get('ErrorCode') == 2:
-        print('⚠️ Bing quota reached; skipped')
-    else:
-        print(f"❌ Bing recrawl failed: {r.status_code} - {data.get('Message', r.text)}")
+        return True, '✅ Bing recrawl submitted'
+    if data.get('ErrorCode') == 2:
+        return False, '⚠️ Bing quota reached; skipped'
+    return False, f"❌ Bing recrawl failed: {r.status_code} - {data.get('Message', r.text)}"
+
+# Recrawl endpoints, each called as submit(base, urls); they run concurrently
+SUBMITTERS = (_submit_bing,)
+
+# Log a background submission once it settles; nothing downstream waits on it
+def _log_submission(fut) -> None:
+    exc = fut.exception()
+    print(f"❌ Recrawl submission failed: {exc}" if exc else fut.result()[1])
 
 # Entry point
 if __name__ == '__main__':
-    inject_metadata()
-    update_sitemap_and_bing()
+    # The two tasks touch disjoint files, so overlap their network waits
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futs = [ex.submit(inject_metadata), ex.submit(update_sitemap)]
+        for f in futs:
+            f.result()
+    # A changed page still needs a fresh lastmod
+    if _staged and 'sitemap.xml' not in _staged:
+        update_sitemap(force=True)
+    # Only ask for a recrawl once new content is actually on the branch
+    if commit_staged('feat: single landing page w/ visible & hidden comparison + sitemap'):
+        for submit in SUBMITTERS:
+            _bg.submit(submit, BASE, sorted(_recrawl)).add_done_callback(_log_submission)
+    # Let queued background POSTs finish before the process exits
+    _bg.shutdown(wait=True)
     print('🎉 Done!')
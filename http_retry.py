@@ -0,0 +1,87 @@
+"""
+http_retry.py
+
+Bounded retry helper for the orchestrator's HTTP calls:
+- retries 429/5xx responses and the caller's transient exceptions (retry_on), up to max_attempts
+- waits for Retry-After when the server sends it (seconds or HTTP-date)
+- otherwise backs off min(120, 2**n) seconds plus jitter, at least 30s after a 429
+- fails fast with GitHubRateLimitError when GitHub's primary limit resets too far out
+"""
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+RETRY_STATUSES    = {429, 500, 502, 503, 504}
+MAX_DELAY         = 120
+RATE_LIMIT_FLOOR  = 30
+GITHUB_RESET_WAIT = 120
+
+class GitHubRateLimitError(RuntimeError):
+    """GitHub's primary rate limit is exhausted and resets too late to wait for."""
+
+# Seconds requested by a Retry-After header, or None if absent/unparseable
+def _retry_after(resp) -> float | None:
+    value = resp.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    # A '-0000' zone parses as naive; HTTP-dates are always UTC
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def _backoff(attempt: int, jitter: float) -> float:
+    return min(MAX_DELAY, 2 ** attempt) + random.random() * jitter
+
+# Delay before retrying resp, or None if it should be returned as-is
+def _delay_for(resp, attempt: int, jitter: float) -> float | None:
+    # Primary limit: wait for the reset if it is close, otherwise give up now
+    if resp.status_code in (403, 429) and resp.headers.get('X-RateLimit-Remaining') == '0':
+        reset = float(resp.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        if reset > GITHUB_RESET_WAIT:
+            raise GitHubRateLimitError(f"GitHub rate limit resets in {int(reset)}s")
+        return max(reset, 0.0) + random.random() * jitter
+    # Secondary limits come back as 403 with Retry-After
+    if resp.status_code not in RETRY_STATUSES and not (
+            resp.status_code == 403 and 'Retry-After' in resp.headers):
+        return None
+    delay = _retry_after(resp)
+    if delay is None:
+        delay = _backoff(attempt, jitter)
+        if resp.status_code == 429:
+            delay = max(delay, RATE_LIMIT_FLOOR)
+    # A server asking for more than MAX_DELAY is not worth blocking the run on
+    return delay if delay <= MAX_DELAY else None
+
+# session.request() with retries; the final response is returned for the caller to check
+# retry_on lists the exception types worth another attempt; give_up_on carves
+# permanent failures back out of them. Passed in so requests isn't imported here.
+def request_with_backoff(session, method: str, url: str, *, max_attempts: int = 5,
+                         jitter: float = 1.0, retry_on: tuple = (), give_up_on: tuple = (),
+                         **kwargs):
+    for attempt in range(max_attempts):
+        last = attempt == max_attempts - 1
+        try:
+            resp = session.request(method, url, **kwargs)
+        except retry_on as exc:
+            if last or isinstance(exc, give_up_on):
+                raise
+            delay = _backoff(attempt, jitter)
+        else:
+            delay = _delay_for(resp, attempt, jitter)
+            if delay is None or last:
+                return resp
+        time.sleep(delay)
+
+def post_with_backoff(session, url: str, *, json=None, headers=None, max_attempts: int = 5,
+                      **kwargs):
+    return request_with_backoff(session, 'POST', url, json=json, headers=headers,
+                                max_attempts=max_attempts, **kwargs)
@@ -0,0 +1,38 @@
+"""
+rate_limit.py
+
+Process-wide pacing for GitHub write calls:
+- TokenBucket allows `burst` calls at once, then refills at `rps` per second
+- write_limit() blocks until a write token is available (default 1/s, burst 3)
+so bursts of mutating calls stay clear of GitHub's secondary rate limit.
+"""
+import time
+import threading
+from contextlib import contextmanager
+
+class TokenBucket:
+    def __init__(self, rps: float, burst: int):
+        self.rps = rps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Take one token, sleeping until one has refilled if the bucket is empty
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rps)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rps if self._tokens < 0 else 0.0
+        # Sleep outside the lock; the token is already reserved
+        if wait:
+            time.sleep(wait)
+
+_writes = TokenBucket(rps=1.0, burst=3)
+
+@contextmanager
+def write_limit():
+    _writes.acquire()
+    yield